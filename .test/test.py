@@ -1,5 +1,5 @@
 from typing import Literal, Dict, List, TypedDict
-import os, json
+import os, json, sys
 
 import brainbridge.utils.timer as timer
 import brainbridge.lib.runtime.provider_converter.converter as converter
@@ -64,6 +64,8 @@ def display_chat(messages: List[Message]):
             print(f"\033[1;36m{msg['role'].upper()}\033[0m: \033[1;37m{msg['content']}\033[0m\n")
 
 _rq = rq.Request(timeout=100)
+_loads = json.loads
+_unwrap = converter.Operator.ResponseUnwrap.unwrap
 flags = ["/help", "/exit", "/model", "/rm_last_msg", "/clear_all", "/new_chat", "/mk_title", "/save_chat", "/select_chat"]
 HELPS = """This is a simple command-line chat interface. You can type your messages and receive responses from the AI model. Here are the available commands:\n\
 Here are the available commands:\n\
@@ -161,8 +163,12 @@ def main():
                 json=payload.information,
             )
             try:
-                print("\033[1;36mASSISTANT\033[0m: ", end="")
+                write, flush = sys.stdout.write, sys.stdout.flush
+                write("\033[1;36mASSISTANT\033[0m: ")
+                flush()
                 chunks: List[str] = []
+                buf: List[str] = []
+                buf_len = 0
                 for chunk in resp:
                     event_data = chunk.get("data", "").strip()
                     if not event_data:
@@ -170,15 +176,22 @@ def main():
                     if event_data == "[DONE]":
                         break
 
-                    rsp = converter.Operator.ResponseUnwrap.unwrap(
-                        "openai_completion",
-                        json.loads(event_data),
-                    )
+                    rsp = _unwrap("openai_completion", _loads(event_data))
                     text = rsp.get("response_text")
                     if text:
-                        print(f"\033[1;37m{text}\033[0m", end="", flush=True)
                         chunks.append(text)
-                print()
+                        # Batch token writes instead of one flushed print per delta.
+                        buf.append(f"\033[1;37m{text}\033[0m")
+                        buf_len += len(text)
+                        if buf_len >= 64 or "\n" in text:
+                            write("".join(buf))
+                            flush()
+                            buf.clear()
+                            buf_len = 0
+                if buf:
+                    write("".join(buf))
+                write("\n")
+                flush()
                 messages.append(Message(role="assistant", content="".join(chunks)))
 
             except Exception as e:
@@ -1,14 +1,44 @@
+import sys
+from collections import deque
 from json import loads
+from typing import Deque, List
 
 from brainbridge.lib.runtime.provider_converter.converter import Converter, Operator
 from brainbridge.lib.runtime.requests_core.request_core import Request
 
+MAX_HISTORY = 50
+
 
 def main() -> None:
     requester = Request(timeout=120)
     headers_builder = Operator.HeadersBuilder()
     output_parser = Operator.ResponseUnwrap()
-    history = []
+    unwrap = output_parser.unwrap
+    # deque(maxlen=...) drops the oldest turn in O(1) once the cap is hit.
+    history: Deque[dict] = deque(maxlen=MAX_HISTORY)
+
+    write, flush = sys.stdout.write, sys.stdout.flush
+    buf: List[str] = []
+    buf_len = 0
+
+    def emit(text: str) -> None:
+        # Batch token writes; flush on newlines or once ~64 chars pile up.
+        nonlocal buf_len
+        buf.append(text)
+        buf_len += len(text)
+        if buf_len >= 64 or "\n" in text:
+            write("".join(buf))
+            flush()
+            buf.clear()
+            buf_len = 0
+
+    def drain() -> None:
+        nonlocal buf_len
+        if buf:
+            write("".join(buf))
+            flush()
+            buf.clear()
+            buf_len = 0
 
     while True:
         reasoning = False
@@ -16,7 +46,7 @@ def main() -> None:
         if user_input.replace(" ", "").lower() in ["break", "stop", "exit", "bye"]:
             break
         history.append({"role": "user", "content": user_input})
-        payload = Converter("openai_completion", model="openai/gpt-oss-20b", messages=history).information
+        payload = Converter("openai_completion", model="openai/gpt-oss-20b", messages=list(history)).information
         headers = headers_builder.builder(
             api_token="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"
         )
@@ -28,32 +58,37 @@ def main() -> None:
         )
         assistant_output = ""
         think_len = 0
-        print("Assistant: ", end="")
+        write("Assistant: ")
+        flush()
         for resp in response_stream:
-            if resp["data"].replace("\n", "") == "[DONE]":
+            raw_data = resp["data"]
+            if not raw_data or raw_data == "[DONE]":
                 continue
-            output = output_parser.unwrap("openai_completion", loads(resp["data"]))
-            if not output["response_usage"]:
+            output = unwrap("openai_completion", loads(raw_data))
+            usage = output["response_usage"]
+            if not usage:
                 delta = output["raw_response"]["choices"][0]["delta"]
                 if "reasoning" in delta:
                     if not reasoning:
                         reasoning = True
-                        print("\n<think/>\n", end="")
+                        emit("\n<think/>\n")
                     think = delta["reasoning"]
                     think_len += len(think)
-                    print(think, end="")
+                    emit(think)
                     if think_len >= 120:
-                        print("")
+                        emit("\n")
                         think_len -= 120
                 else:
                     if reasoning:
                         reasoning = False
-                        print("\n</think>\n")
-                if output["response_text"]:
-                    print(output["response_text"], end="")
-                    assistant_output += output["response_text"]
-            if output.get("response_usage"):
-                print(f"\nUsage: {output['response_usage']}")
+                        emit("\n</think>\n\n")
+                text = output["response_text"]
+                if text:
+                    emit(text)
+                    assistant_output += text
+            else:
+                emit(f"\nUsage: {usage}\n")
+        drain()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
 
@@ -98,6 +99,7 @@ def iter_tree_files(tree: Mapping[str, Sequence[str | Dict[str, Any]]]) -> Itera
             yield from _walk(root, item)
 
 
+@lru_cache(maxsize=None)
 def root_prefix_id(root: str) -> str:
     """Create a stable identifier for a root prefix using SHA256."""
     root_posix = to_posix(root)
@@ -116,15 +118,17 @@ def relative_under_root(root: str, file_path: str) -> str:
 
 def b64_encode_stream(src: Iterable[bytes], wrap: int = B64_WRAP) -> Iterator[str]:
     """Base64 encode a bytes stream and yield wrapped text lines."""
-    buf = b""
+    # bytearray mutates in place; rebuilding immutable bytes per chunk would
+    # copy the remainder every iteration and go quadratic on large streams.
+    buf = bytearray()
     for chunk in src:
-        buf += chunk
+        buf.extend(chunk)
         take = (len(buf) // 3) * 3
         if take:
             out = base64.b64encode(buf[:take]).decode("ascii")
             for i in range(0, len(out), wrap):
                 yield out[i : i + wrap]
-            buf = buf[take:]
+            del buf[:take]
     if buf:
         out = base64.b64encode(buf).decode("ascii")
         for i in range(0, len(out), wrap):
@@ -396,8 +400,16 @@ def aggregate_to_backup(
                 },
             )
 
+            # One write per 76-char line means ~14k dispatches per MiB;
+            # batch the payload lines and flush them in large joined blocks.
+            payload_lines: list[str] = []
             for b64_line in b64_encode_stream(read_chunks()):
-                backup_file.write(f"{PAYLOAD_PREFIX}{b64_line}\n")
+                payload_lines.append(f"{PAYLOAD_PREFIX}{b64_line}\n")
+                if len(payload_lines) >= 4096:
+                    backup_file.write("".join(payload_lines))
+                    payload_lines.clear()
+            if payload_lines:
+                backup_file.write("".join(payload_lines))
 
             _write_json_line(
                 backup_file,
@@ -3,19 +3,21 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from json import JSONDecodeError, loads
-from os import listdir, path, scandir
+from os import path, scandir, stat
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Set, Union
+from stat import S_ISDIR, S_ISREG
+from typing import Any, Dict, Iterator, List, Literal, Set, Tuple, Union
 
 from brainbridge.lib.runtime.file_utils.ignores import IgnoreSpec, normalize_ignores, should_ignore_name
-from brainbridge.utils.chardet import detect
 
 __all__ = [
     "return_path_of_dir_under_root_dir",
     "return_dir_member",
     "valid_path",
     "return_full_tree",
+    "iter_full_tree",
     "write_content_tofile",
     "read_file",
     "read_json",
@@ -23,6 +25,19 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _repo_root() -> Path:
+    """Locate the project root by walking upward until ``pyproject.toml`` is found."""
+    current_file = Path(__file__).resolve()
+    for parent in current_file.parents:
+        if (parent / "pyproject.toml").exists():
+            return parent
+    raise ValueError(
+        f"Unexpected file path: {current_file}. Could not locate repository root via 'pyproject.toml'."
+    )
+
+
+@lru_cache(maxsize=None)
 def return_path_of_dir_under_root_dir(dir_name: str) -> str:
     """
     Returns the absolute path of a specified directory located directly under the project's root directory.
@@ -34,20 +49,7 @@ def return_path_of_dir_under_root_dir(dir_name: str) -> str:
                         if the specified `dir_name` is not found under the root,
                         or if `dir_name` is not a directory.
     """
-    current_file = Path(__file__).resolve()
-    root_dir: Path | None = None
-
-    for parent in current_file.parents:
-        if (parent / "pyproject.toml").exists():
-            root_dir = parent
-            break
-
-    if root_dir is None:
-        raise ValueError(
-            f"Unexpected file path: {current_file}. Could not locate repository root via 'pyproject.toml'."
-        )
-
-    target_dir = root_dir / dir_name
+    target_dir = _repo_root() / dir_name
     if not target_dir.exists():
         raise ValueError(f'Cannot find "{dir_name}" under root directory.')
     if not target_dir.is_dir():
@@ -60,14 +62,19 @@ def return_dir_member(dir_path: str) -> Union[Dict[str, Literal["file", "dir"]],
     Returns a dictionary of members (files and subdirectories) within a given directory.
     If the provided path is a file, returns None.
     """
-    if not path.isfile(dir_path) and not path.isdir(dir_path):
+    try:
+        mode = stat(dir_path).st_mode
+    except OSError:
+        raise ValueError(f"Invalid path: {dir_path}") from None
+    if not S_ISDIR(mode):
+        if S_ISREG(mode):
+            return None
         raise ValueError(f"Invalid path: {dir_path}")
-    if path.isfile(dir_path):
-        return None
 
     member_list: Dict[str, Literal["file", "dir"]] = {}
-    for member in listdir(dir_path):
-        member_list[member] = "file" if path.isfile(path.join(dir_path, member)) else "dir"
+    with scandir(dir_path) as entries:
+        for entry in entries:
+            member_list[entry.name] = "file" if entry.is_file() else "dir"
     return member_list
 
 
@@ -83,6 +90,11 @@ def valid_path(target_path: str, is_file: bool = True) -> None:
         raise ValueError(f"Path is not a directory: {target_path}")
 
 
+def _fast_normalize(p: str) -> str:
+    """Normalize a path to forward-slash form without resolving symlinks."""
+    return path.normpath(p).replace("\\", "/")
+
+
 def return_full_tree(
     *base_paths: str,
     ignores: IgnoreSpec = None,
@@ -93,14 +105,7 @@ def return_full_tree(
     result_tree: Dict[str, List[Union[str, Dict[str, Any]]]] = {}
     normalized_ignores = normalize_ignores(ignores)
 
-    realpath = path.realpath
-    join = path.join
-    normpath = path.normpath
-
-    def _fast_normalize(p: str) -> str:
-        return normpath(p).replace("\\", "/")
-
-    def _explore_recursive(current_dir: str, visited: Set[str]) -> List[Union[str, Dict[str, Any]]]:
+    def _explore_recursive(current_dir: str, visited: Set[Tuple[int, int]]) -> List[Union[str, Dict[str, Any]]]:
         content_list: List[Union[str, Dict[str, Any]]] = []
 
         try:
@@ -113,12 +118,15 @@ def return_full_tree(
 
                     raw_path = entry.path
                     normalized_path = _fast_normalize(raw_path)
-                    real_p = realpath(raw_path)
-                    if real_p in visited:
+                    # (device, inode) identifies the directory without the
+                    # per-component lstat walk realpath would do.
+                    entry_stat = entry.stat()
+                    inode_key = (entry_stat.st_dev, entry_stat.st_ino)
+                    if inode_key in visited:
                         content_list.append({normalized_path: [f"_loop_detected_at:{normalized_path}"]})
                         continue
 
-                    new_visited = visited | {real_p}
+                    new_visited = visited | {inode_key}
                     content_list.append({normalized_path: _explore_recursive(raw_path, new_visited)})
                 elif entry.is_file():
                     if should_ignore_name(entry.name, "file", normalized_ignores):
@@ -138,16 +146,87 @@ def return_full_tree(
     for base_path_str in base_paths:
         valid_path(base_path_str, is_file=False)
         norm_base = _fast_normalize(base_path_str)
-        result_tree[norm_base] = _explore_recursive(base_path_str, {realpath(base_path_str)})
+        base_stat = stat(base_path_str)
+        result_tree[norm_base] = _explore_recursive(base_path_str, {(base_stat.st_dev, base_stat.st_ino)})
 
     return result_tree
 
 
-def _auto_file_code(file_path: str) -> str:
-    """Detect the encoding of a given file."""
+_DETECT_PREFIX_BYTES = 65536
+
+
+@lru_cache(maxsize=1024)
+def _auto_code_cached(file_path: str, _mtime_ns: int, _size: int) -> str:
+    """Detect the encoding of ``file_path``; keyed on (path, mtime, size)."""
+    from brainbridge.utils.chardet import detect
+
     with open(file_path, "rb") as f:
-        detected = detect(f.read()).get("encoding")
-        return detected or "utf-8"
+        # A 64 KiB prefix is almost always enough; the truncated sample can
+        # split a multi-byte character, so fall back to the whole file when
+        # detection is unsure.
+        prefix = f.read(_DETECT_PREFIX_BYTES)
+        result = detect(prefix)
+        if len(prefix) == _DETECT_PREFIX_BYTES and (
+            result.get("encoding") is None or result.get("confidence", 0.0) < 0.5
+        ):
+            result = detect(prefix + f.read())
+        return result.get("encoding") or "utf-8"
+
+
+def iter_full_tree(
+    *base_paths: str,
+    ignores: IgnoreSpec = None,
+) -> Iterator[Tuple[Literal["dir", "file", "note"], str]]:
+    """
+    Lazily walk the provided directories, yielding one entry at a time.
+
+    Yields ``("dir", path)`` / ``("file", path)`` tuples in the same sorted
+    depth-first order as :func:`return_full_tree`, and ``("note", marker)``
+    for the loop/permission/error markers. Unlike ``return_full_tree``, the
+    walk keeps O(depth) state instead of materializing the whole tree.
+    """
+    normalized_ignores = normalize_ignores(ignores)
+
+    def _walk(current_dir: str, visited: Set[Tuple[int, int]]) -> Iterator[Tuple[Literal["dir", "file", "note"], str]]:
+        try:
+            entries = sorted(scandir(current_dir), key=lambda entry: entry.name)
+        except PermissionError:
+            yield "note", f"_permission_denied_for:{_fast_normalize(current_dir)}"
+            return
+        except OSError as exc:
+            yield "note", f"_error_accessing:{_fast_normalize(current_dir)}:{exc}"
+            return
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=True):
+                if should_ignore_name(entry.name, "dir", normalized_ignores):
+                    continue
+
+                normalized_path = _fast_normalize(entry.path)
+                entry_stat = entry.stat()
+                inode_key = (entry_stat.st_dev, entry_stat.st_ino)
+                if inode_key in visited:
+                    yield "note", f"_loop_detected_at:{normalized_path}"
+                    continue
+
+                yield "dir", normalized_path
+                yield from _walk(entry.path, visited | {inode_key})
+            elif entry.is_file():
+                if should_ignore_name(entry.name, "file", normalized_ignores):
+                    continue
+                yield "file", _fast_normalize(entry.path)
+
+    for base_path_str in base_paths:
+        valid_path(base_path_str, is_file=False)
+        base_stat = stat(base_path_str)
+        yield "dir", _fast_normalize(base_path_str)
+        yield from _walk(base_path_str, {(base_stat.st_dev, base_stat.st_ino)})
+
+
+def _auto_file_code(file_path: str) -> str:
+    """Detect the encoding of a given file, reusing prior results while it is unchanged."""
+    st = stat(file_path)
+    return _auto_code_cached(file_path, st.st_mtime_ns, st.st_size)
 
 
 def write_content_tofile(
@@ -190,8 +269,8 @@ def read_file(
         file_code = _auto_file_code(file_path)
     with open(file_path, "r", encoding=file_code) as f:
         if line_by_line:
-            return [line for line in f]
-        return str(f.read())
+            return f.readlines()
+        return f.read()
 
 
 def read_json(
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from json import dumps
 from os import path
-from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple
+from sys import intern
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple
 
 from brainbridge.lib.runtime.file_utils import read_json, return_path_of_dir_under_root_dir
 
@@ -122,6 +124,102 @@ class _ConfigEngine:
         return cls._CACHE["base_match"], cls._CACHE["escape_table"]
 
 
+_STR_SPEC_CACHE: Dict[str, Tuple[Tuple[type, ...], Tuple[str, ...]]] = {}
+
+_MEMO_VALUE_TYPES = (str, int, float, bool, type(None))
+_ITEM_MEMO: Dict[Tuple[int, Tuple[Tuple[str, Any], ...]], Tuple[Any, bool]] = {}
+_ITEM_MEMO_MAX = 4096
+
+
+_PATH_PARTS_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+_FAST_TEXT_CACHE: Dict[int, Tuple[Any, bool]] = {}
+
+
+def _accepts_plain_text_message(candidate: Dict[str, Any], disc_key: str) -> bool:
+    """
+    True when a {disc_key, 'content'} dict with string content always satisfies
+    this candidate schema, so full per-key validation can be skipped for it.
+    """
+    entry = _FAST_TEXT_CACHE.get(id(candidate))
+    if entry is not None and entry[0] is candidate:
+        return entry[1]
+
+    ok = False
+    content_spec = candidate.get("content")
+    if isinstance(content_spec, str) and str in _compile_str_spec(content_spec)[0]:
+        ok = all(
+            key in (disc_key, "content", "requirements") or not Converter._is_literal_discriminator(schema)
+            for key, schema in candidate.items()
+        )
+        required = candidate.get("requirements", [])
+        if ok and isinstance(required, list) and any(
+            isinstance(req, str) and req not in (disc_key, "content") for req in required
+        ):
+            ok = False
+
+    # Keep a reference to the spec so its id() stays unique while cached.
+    _FAST_TEXT_CACHE[id(candidate)] = (candidate, ok)
+    return ok
+
+_DISC_MAP_CACHE: Dict[int, Tuple[Any, Optional[Tuple[str, Dict[str, Any]]]]] = {}
+
+
+def _candidate_discriminator_map(candidates: List[Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Return (key, {literal: candidate}) when every candidate schema is a dict
+    discriminated by a single-literal value on one shared key, else None.
+    Cached per spec identity so the scan runs once per distinct spec list.
+    """
+    entry = _DISC_MAP_CACHE.get(id(candidates))
+    if entry is not None and entry[0] is candidates:
+        return entry[1]
+
+    mapping: Optional[Tuple[str, Dict[str, Any]]] = None
+    if candidates and all(type(candidate) is dict for candidate in candidates):
+        for key in candidates[0]:
+            literals: Optional[Dict[str, Any]] = {}
+            for candidate in candidates:
+                schema = candidate.get(key)
+                if not isinstance(schema, str):
+                    literals = None
+                    break
+                mapped_types, tokens = _compile_str_spec(schema)
+                if mapped_types or len(tokens) != 1 or tokens[0] in literals:
+                    literals = None
+                    break
+                literals[tokens[0]] = candidate
+            if literals:
+                mapping = (key, literals)
+                break
+
+    # Keep a reference to the spec so its id() stays unique while cached.
+    _DISC_MAP_CACHE[id(candidates)] = (candidates, mapping)
+    return mapping
+
+
+def _item_fingerprint(item: Any) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """Return a hashable fingerprint for a flat message-like dict, or None when not fingerprintable."""
+    if type(item) is not dict:
+        return None
+    for key, value in item.items():
+        if type(key) is not str or type(value) not in _MEMO_VALUE_TYPES:
+            return None
+    return tuple(sorted(item.items()))
+
+
+def _compile_str_spec(spec: str) -> Tuple[Tuple[type, ...], Tuple[str, ...]]:
+    """Compile a pipe-separated type spec into (mapped types, raw tokens), cached per spec string."""
+    compiled = _STR_SPEC_CACHE.get(spec)
+    if compiled is None:
+        tokens = tuple(intern(token.strip()) for token in spec.split("|") if token.strip())
+        mapped = tuple(
+            {Converter._TYPE_MAPPING[token.lower()] for token in tokens if token.lower() in Converter._TYPE_MAPPING}
+        )
+        compiled = _STR_SPEC_CACHE[spec] = (mapped, tokens)
+    return compiled
+
+
 class Converter:
     """
     Argument converter for transforming generic request arguments into provider-specific format.
@@ -135,6 +233,9 @@ class Converter:
         "list": list, "dict": dict, "none": type(None),
     }
     _ESSENTIAL_ARGS: tuple[str, ...] = ("model", "messages")
+    _ESSENTIAL_KEYS: frozenset[str] = frozenset(_ESSENTIAL_ARGS)
+
+    __slots__ = ("provider", "information", "_information_json")
 
     def __init__(self, provider: str, **kwargs: Any) -> None:
         """
@@ -160,15 +261,35 @@ class Converter:
 
         kwargs = Converter._generic_arg_replace(provider, kwargs, base_match)
 
+        provider_input = selected_provider_role.get("input", {})
         for key, value in kwargs.items():
-            if key not in selected_provider_role.get("input", {}):
+            input_spec = provider_input.get(key)
+            if input_spec is None:
                 continue
-            is_allowed = Converter.parse_types(selected_provider_role["input"][key], value)
+            is_allowed = Converter.parse_types(input_spec, value)
             if is_allowed is False:
                 raise ValueError(f"Type of arg '{key}' mismatch for {provider}")
 
         self.provider = provider
         self.information: Dict[str, Any] = kwargs
+        self._information_json: Optional[bytes] = None
+
+    @property
+    def information_json(self) -> bytes:
+        """
+        UTF-8 encoded JSON serialization of :attr:`information`.
+
+        The payload is serialized on first access and cached, so callers that
+        send the same converted arguments repeatedly pay for one dumps() pass.
+
+        Example:
+        >>> _converter = Converter("openai_completion", model="gpt-4", messages=[])
+        >>> isinstance(_converter.information_json, bytes)
+        True
+        """
+        if self._information_json is None:
+            self._information_json = dumps(self.information, ensure_ascii=False).encode("utf-8")
+        return self._information_json
 
     @staticmethod
     def parse_types(str_type: Any, _object: Any) -> Optional[bool]:
@@ -192,63 +313,144 @@ class Converter:
         >>> Converter.parse_types("none", None)
         True
         """
-        if isinstance(str_type, list):
-            if not isinstance(_object, list):
-                return False
-            if not str_type:
-                return True
-            if len(str_type) == 1:
-                item_schema = str_type[0]
-                return all(Converter.parse_types(item_schema, item) is True for item in _object)
-            return all(
-                any(Converter.parse_types(candidate_schema, item) is True for candidate_schema in str_type)
-                for item in _object
-            )
+        handler = Converter._SPEC_HANDLERS.get(type(str_type))
+        if handler is not None:
+            return handler(str_type, _object)
 
+        # Subclasses of the schema containers still take the shape-specific path.
+        if isinstance(str_type, list):
+            return Converter._parse_list_spec(str_type, _object)
         if isinstance(str_type, str):
-            tokens = [token.strip() for token in str_type.split("|") if token.strip()]
-            if not tokens:
-                return False
+            return Converter._parse_str_spec(str_type, _object)
+        if isinstance(str_type, dict):
+            return Converter._parse_dict_spec(str_type, _object)
 
-            for token in tokens:
-                mapped_type = Converter._TYPE_MAPPING.get(token.lower())
-                if mapped_type is not None and isinstance(_object, mapped_type):
-                    return True
-                if isinstance(_object, str) and _object == token:
-                    return True
-            return False
+        return isinstance(_object, type(str_type))
 
-        if isinstance(str_type, dict):
-            if not isinstance(_object, dict):
+    @staticmethod
+    def _parse_list_spec(str_type: List[Any], _object: Any) -> Optional[bool]:
+        if not isinstance(_object, list):
+            return False
+        if not str_type:
+            return True
+        parse = Converter.parse_types
+        if len(str_type) == 1:
+            item_schema = str_type[0]
+            item_handler = Converter._SPEC_HANDLERS.get(type(item_schema))
+            if item_handler is not None:
+                return all(item_handler(item_schema, item) is True for item in _object)
+            return all(parse(item_schema, item) is True for item in _object)
+
+        discriminator = _candidate_discriminator_map(str_type)
+        if discriminator is not None and all(
+            type(item) is dict and type(item.get(discriminator[0])) is str for item in _object
+        ):
+            disc_key, disc_table = discriminator
+
+            # Pass 1: resolve every item's candidate in one tight lookup loop.
+            candidates = [disc_table.get(item[disc_key]) for item in _object]
+            if None in candidates:
                 return False
 
-            required_keys = str_type.get("requirements", [])
-            if isinstance(required_keys, list):
-                for required_key in required_keys:
-                    if isinstance(required_key, str) and required_key not in _object:
-                        return False
+            # Pass 2: validate each item against its resolved candidate.
+            for item, candidate_schema in zip(_object, candidates):
+                fingerprint = _item_fingerprint(item)
+                memo_key = None
+                if fingerprint is not None:
+                    memo_key = (id(str_type), fingerprint)
+                    entry = _ITEM_MEMO.get(memo_key)
+                    if entry is not None:
+                        if not entry[1]:
+                            return False
+                        continue
+
+                if (
+                    len(item) == 2
+                    and type(item.get("content")) is str
+                    and _accepts_plain_text_message(candidate_schema, disc_key)
+                ):
+                    # Dominant case: a plain {'role': ..., 'content': '<text>'} turn.
+                    allowed = True
+                else:
+                    allowed = parse(candidate_schema, item) is True
+
+                if memo_key is not None:
+                    if len(_ITEM_MEMO) >= _ITEM_MEMO_MAX:
+                        _ITEM_MEMO.clear()
+                    # Keep a reference to the spec so its id() stays unique while cached.
+                    _ITEM_MEMO[memo_key] = (str_type, allowed)
+                if not allowed:
+                    return False
+            return True
 
-            for key, schema in str_type.items():
-                if key == "requirements":
+        for item in _object:
+            fingerprint = _item_fingerprint(item)
+            memo_key = None
+            if fingerprint is not None:
+                memo_key = (id(str_type), fingerprint)
+                entry = _ITEM_MEMO.get(memo_key)
+                if entry is not None:
+                    if not entry[1]:
+                        return False
                     continue
 
-                is_discriminator = Converter._is_literal_discriminator(schema)
-                if is_discriminator and key not in _object:
-                    return False
-                if key not in _object:
-                    continue
-                if Converter.parse_types(schema, _object[key]) is not True:
-                    return False
+            allowed = any(parse(candidate_schema, item) is True for candidate_schema in str_type)
+            if memo_key is not None:
+                if len(_ITEM_MEMO) >= _ITEM_MEMO_MAX:
+                    _ITEM_MEMO.clear()
+                # Keep a reference to the spec so its id() stays unique while cached.
+                _ITEM_MEMO[memo_key] = (str_type, allowed)
+            if not allowed:
+                return False
+        return True
+
+    @staticmethod
+    def _parse_str_spec(str_type: str, _object: Any) -> Optional[bool]:
+        mapped_types, tokens = _compile_str_spec(str_type)
+        if not tokens:
+            return False
+
+        if mapped_types and isinstance(_object, mapped_types):
+            # bool subclasses int; only an explicit 'bool' token may accept it.
+            if type(_object) is not bool or bool in mapped_types:
+                return True
+        if isinstance(_object, str) and _object in tokens:
             return True
+        return False
 
-        return isinstance(_object, type(str_type))
+    @staticmethod
+    def _parse_dict_spec(str_type: Dict[str, Any], _object: Any) -> Optional[bool]:
+        if not isinstance(_object, dict):
+            return False
+
+        required_keys = str_type.get("requirements", [])
+        if isinstance(required_keys, list):
+            for required_key in required_keys:
+                if isinstance(required_key, str) and required_key not in _object:
+                    return False
+
+        parse = Converter.parse_types
+        is_literal = Converter._is_literal_discriminator
+        for key, schema in str_type.items():
+            if key == "requirements":
+                continue
+
+            if is_literal(schema) and key not in _object:
+                return False
+            if key not in _object:
+                continue
+            if parse(schema, _object[key]) is not True:
+                return False
+        return True
+
+    _SPEC_HANDLERS = {list: _parse_list_spec, str: _parse_str_spec, dict: _parse_dict_spec}
 
     @staticmethod
     def _is_literal_discriminator(schema: Any) -> bool:
         if not isinstance(schema, str):
             return False
-        tokens = [token.strip() for token in schema.split("|") if token.strip()]
-        return bool(tokens) and all(token.lower() not in Converter._TYPE_MAPPING for token in tokens)
+        mapped_types, tokens = _compile_str_spec(schema)
+        return bool(tokens) and not mapped_types
 
     @staticmethod
     def _generic_arg_replace(provider: str, kwargs: Mapping[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
@@ -269,9 +471,9 @@ class Converter:
         """
         provider_map = config.get(provider, {}).get("input", {})
 
-        for essential_arg in Converter._ESSENTIAL_ARGS:
-            if essential_arg not in kwargs:
-                raise ValueError(f"Missing essential arg: '{essential_arg}'")
+        if not Converter._ESSENTIAL_KEYS <= kwargs.keys():
+            missing = next(arg for arg in Converter._ESSENTIAL_ARGS if arg not in kwargs)
+            raise ValueError(f"Missing essential arg: '{missing}'")
 
         translated_info: Dict[str, Any] = {}
         for key, value in kwargs.items():
@@ -317,9 +519,13 @@ class Operator:
             >>> headers["Content-Type"]
             'application/json'
             """
-            header = {"Content-Type": "application/json", "Authorization": f"Bearer {api_token}"}
-            if include_accept: header["Accept"] = "application/json"
-            return header
+            if include_accept:
+                return {
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {api_token}",
+                    "Accept": "application/json",
+                }
+            return {"Content-Type": "application/json", "Authorization": f"Bearer {api_token}"}
 
     class ResponseUnwrap:
         """
@@ -331,6 +537,7 @@ class Operator:
         """
         _METADATA_FIELDS: frozenset[str] = frozenset(
             {"role", "index", "finish_reason", "object", "id", "created", "model", "logprobs"})
+        _DEFAULT_CONTENT_KEYS: tuple[str, ...] = ("content", "text", "refusal")
 
         @staticmethod
         def _get_nested_value(data: Any, path_str: str) -> Any:
@@ -349,7 +556,9 @@ class Operator:
             42
             """
             if not path_str or data is None: return None
-            parts = path_str.split('/')
+            parts = _PATH_PARTS_CACHE.get(path_str)
+            if parts is None:
+                parts = _PATH_PARTS_CACHE[path_str] = tuple(path_str.split('/'))
             current = data
             for i, part in enumerate(parts):
                 if part.startswith('*'):
@@ -358,8 +567,8 @@ class Operator:
                     if not isinstance(target_list, list): return None
                     remaining_path = "/".join(parts[i + 1:])
                     if not remaining_path: return target_list
-                    results = [Operator.ResponseUnwrap._get_nested_value(item, remaining_path) for item in target_list]
-                    return [r for r in results if r is not None]
+                    get_nested = Operator.ResponseUnwrap._get_nested_value
+                    return [r for item in target_list if (r := get_nested(item, remaining_path)) is not None]
                 else:
                     if isinstance(current, dict):
                         current = current.get(part)
@@ -368,7 +577,7 @@ class Operator:
             return current
 
         @staticmethod
-        def _deep_extract_text(obj: Any, content_keys: List[str] | None = None) -> List[str]:
+        def _deep_extract_text(obj: Any, content_keys: Sequence[str] | None = None) -> List[str]:
             """
             Recursively extract text content from nested data structures.
 
@@ -383,7 +592,7 @@ class Operator:
             >>> len(result) > 0
             True
             """
-            if content_keys is None: content_keys = ["content", "text", "refusal"]
+            if content_keys is None: content_keys = Operator.ResponseUnwrap._DEFAULT_CONTENT_KEYS
             texts = []
             if isinstance(obj, str):
                 if obj.strip(): texts.append(obj)
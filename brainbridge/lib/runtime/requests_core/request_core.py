@@ -5,12 +5,16 @@ import io
 import json as _json
 import mimetypes
 import ssl
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from os import path
-from time import localtime
+from collections import deque
+from time import localtime, monotonic, strftime, time
 from typing import (
     IO,
     Any,
     BinaryIO,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -35,7 +39,12 @@ __all__ = [
     "Request",
 ]
 
-FILE_PATH = __file__
+FILE_PATH = sys.intern(__file__)
+
+# Log prefixes are constant per verb; format them once instead of per call.
+_LOG_PREFIXES = {method: f"{FILE_PATH} Request.{method}() " for method in ("get", "post", "put", "delete")}
+
+_LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 FileContent = Union[
     bytes,
@@ -283,13 +292,13 @@ def _encode_multipart_body(
 
 def _prepare_body_and_headers(
     *,
-    data: Optional[Union[str, bytes, Mapping[str, Any]]] = None,
+    data: Optional[Union[str, bytes, Mapping[str, Any], BinaryIO]] = None,
     json_payload: Optional[Mapping[str, Any]] = None,
     files: Optional[Union[Mapping[str, FileValue], Iterable[Tuple[str, FileValue]]]] = None,
     headers: Optional[Mapping[str, Union[str, bytes, None]]] = None,
     auth: Optional[Tuple[str, str]] = None,
     cookies: Optional[Union[Mapping[str, str], List[Tuple[str, str]]]] = None,
-) -> Tuple[Optional[bytes], Dict[str, str]]:
+) -> Tuple[Union[bytes, BinaryIO, None], Dict[str, str]]:
     normalized_headers = _normalize_headers(headers)
 
     auth_header = _normalize_auth(auth)
@@ -328,6 +337,13 @@ def _prepare_body_and_headers(
         normalized_headers["Content-Length"] = str(len(data))
         return data, normalized_headers
 
+    if data is not None and hasattr(data, "read"):
+        # Pass file-like bodies straight through: urllib streams them and
+        # falls back to chunked transfer encoding when no length is known,
+        # so large uploads never get buffered into memory here.
+        normalized_headers.setdefault("Content-Type", "application/octet-stream")
+        return data, normalized_headers
+
     return None, normalized_headers
 
 
@@ -351,45 +367,81 @@ def _build_ssl_context(verify: Optional[Union[bool, str]]) -> ssl.SSLContext:
     return ssl.create_default_context()
 
 
+_OPENER_CACHE: Dict[Tuple[str, Optional[str], Union[bool, str, None]], Any] = {}
+
+
 def _build_opener(proxies: Optional[Mapping[str, str]], verify: Optional[Union[bool, str]], target_url: str) -> Any:
-    handlers: List[Any] = [_url_request.HTTPSHandler(context=_build_ssl_context(verify))]
+    scheme = _url_parse.urlsplit(target_url).scheme or "http"
+    proxy_url: Optional[str] = None
     if proxies:
-        scheme = _url_parse.urlsplit(target_url).scheme or "http"
         proxy_url = proxies.get(scheme) or proxies.get(f"{scheme}://")
+
+    cache_key = (scheme, proxy_url, verify)
+    opener = _OPENER_CACHE.get(cache_key)
+    if opener is None:
+        handlers: List[Any] = [_url_request.HTTPSHandler(context=_build_ssl_context(verify))]
         if proxy_url:
             handlers.append(_url_request.ProxyHandler({scheme: proxy_url}))
-    return _url_request.build_opener(*handlers)
+        opener = _OPENER_CACHE[cache_key] = _url_request.build_opener(*handlers)
+    return opener
 
 
 class Request:
     _class_default_timeout = 5
 
-    def __init__(self, enable_logging: bool = False, timeout: Union[int, float, None] = None):
+    _LOG_MAXLEN = 10_000
+    _CACHE_MAX_ENTRIES = 1024
+
+    def __init__(
+        self,
+        enable_logging: bool = False,
+        timeout: Union[int, float, None] = None,
+        cache_ttl: Union[int, float, None] = None,
+    ):
         self._enable_logging = enable_logging
         self._instance_timeout = timeout if timeout is not None else Request._class_default_timeout
+        self._cache_ttl = cache_ttl
+        if cache_ttl is not None:
+            self._response_cache: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[float, Response]] = {}
         if self._enable_logging:
-            self.logs: List[Dict[str, Union[List[str], str]]] = []
+            self._raw_logs: Deque[Tuple[float, Any]] = deque(maxlen=Request._LOG_MAXLEN)
+        else:
+            # Shadow the method so disabled instances skip even the guard branch.
+            self._log = Request._log_noop
 
     def __len__(self) -> int:
-        return len(self.logs) if self._enable_logging else 0
+        return len(self._raw_logs) if self._enable_logging else 0
 
-    def _log(self, content: Union[List[str], str]):
-        if not self._enable_logging:
-            return
+    @property
+    def logs(self) -> List[Dict[str, str]]:
+        """Formatted log entries; timestamps are rendered lazily on access."""
+        formatted: List[Dict[str, str]] = []
+        last_second = -1
+        log_time_str = ""
+        for timestamp, content in self._raw_logs:
+            second = int(timestamp)
+            if second != last_second:
+                last_second = second
+                log_time_str = strftime(_LOG_TIME_FORMAT, localtime(second))
+            if isinstance(content, str):
+                formatted.append({"time": log_time_str, "content": content})
+            else:
+                formatted.append({
+                    "time": log_time_str,
+                    "content": f"LOG ERROR: Invalid content type '{type(content).__name__}' - {content}",
+                })
+        return formatted
 
-        tn = localtime()
-        log_time_str = f"{tn.tm_year}-{tn.tm_mon:02d}-{tn.tm_mday:02d} {tn.tm_hour:02d}:{tn.tm_min:02d}:{tn.tm_sec:02d}"
+    @staticmethod
+    def _log_noop(content: Union[List[str], str]) -> None:
+        return
 
-        if isinstance(content, str):
-            self.logs.append({"time": log_time_str, "content": content})
-        elif isinstance(content, list):
-            for text_item in content:
-                self.logs.append({"time": log_time_str, "content": text_item})
+    def _log(self, content: Union[List[str], str]):
+        timestamp = time()
+        if type(content) is list:
+            self._raw_logs.extend((timestamp, text_item) for text_item in content)
         else:
-            self.logs.append({
-                "time": log_time_str,
-                "content": f"LOG ERROR: Invalid content type '{type(content).__name__}' - {content}",
-            })
+            self._raw_logs.append((timestamp, content))
 
     @staticmethod
     def _make_request(method: str, url: Union[str, bytes], **kwargs) -> Response:
@@ -427,37 +479,74 @@ class Request:
 
     def _handle_single_request(self, method: str, url: Union[str, bytes], **kwargs) -> Response:
         url_str = str(url)
+        prefix = _LOG_PREFIXES.get(method) or f"{FILE_PATH} Request.{method}() "
+
+        cache_key: Optional[Tuple[str, Tuple[Tuple[str, str], ...]]] = None
+        if method == "get" and self._cache_ttl is not None and not kwargs.get("stream"):
+            request_headers = kwargs.get("headers")
+            cache_key = (url_str, tuple(sorted(request_headers.items())) if request_headers else ())
+            cached = self._response_cache.get(cache_key)
+            if cached is not None and cached[0] > monotonic():
+                if self._enable_logging:
+                    self._log(prefix + "for " + url_str + " served from cache")
+                return cached[1]
+
         try:
             response = self._make_request(method, url, **kwargs)
-            self._log(f"{FILE_PATH} Request.{method}() for {url_str} completed")
+            if cache_key is not None and response.ok:
+                if len(self._response_cache) >= Request._CACHE_MAX_ENTRIES:
+                    self._response_cache.clear()
+                self._response_cache[cache_key] = (monotonic() + self._cache_ttl, response)
+            if self._enable_logging:
+                self._log(prefix + "for " + url_str + " completed")
             return response
         except RequestException as exc:
-            error_msg = f"ERROR: RequestException for {url_str}: {exc}"
-            self._log(f"{FILE_PATH} Request.{method}() failed - {error_msg}")
+            if self._enable_logging:
+                self._log(prefix + f"failed - ERROR: RequestException for {url_str}: {exc}")
             raise
         except Exception as exc:
-            error_msg = f"CRITICAL ERROR: Unexpected exception for {url_str}: {exc}"
-            self._log(f"{FILE_PATH} Request.{method}() failed - {error_msg}")
+            if self._enable_logging:
+                self._log(prefix + f"failed - CRITICAL ERROR: Unexpected exception for {url_str}: {exc}")
             raise
 
     def _handle_multiple_requests(self, method: str, urls: Tuple[Union[str, bytes], ...], **kwargs) -> Dict[str, Union[Response, str]]:
-        result: Dict[str, Union[Response, str]] = {}
+        gathered: Dict[str, Union[Response, str]] = {}
+        failure_logs: List[str] = []
+        prefix = _LOG_PREFIXES.get(method) or f"{FILE_PATH} Request.{method}() "
+
+        # The whole batch shares one payload, so duplicate URLs are identical
+        # requests — issue each distinct URL once and share the result.
+        unique_urls: Dict[str, Union[str, bytes]] = {}
         for u_item in urls:
-            url_str = str(u_item)
-            try:
-                response = self._make_request(method, u_item, **kwargs)
-                response._status_error = not response.ok
-                result[url_str] = response
-            except RequestException as exc:
-                error_msg = f"ERROR: RequestException for {url_str}: {exc}"
-                self._log(f"{FILE_PATH} Request.{method}() failed - {error_msg}")
-                result[url_str] = error_msg
-            except Exception as exc:
-                error_msg = f"CRITICAL ERROR: Unexpected exception for {url_str}: {exc}"
-                self._log(f"{FILE_PATH} Request.{method}() failed - {error_msg}")
-                result[url_str] = error_msg
-
-        self._log(f"{FILE_PATH} Request.{method}() for multiple URLs completed")
+            unique_urls.setdefault(str(u_item), u_item)
+
+        with ThreadPoolExecutor(max_workers=min(32, len(unique_urls))) as executor:
+            futures = {
+                executor.submit(self._make_request, method, u_item, **kwargs): url_str
+                for url_str, u_item in unique_urls.items()
+            }
+            for future in as_completed(futures):
+                url_str = futures[future]
+                try:
+                    gathered[url_str] = future.result()
+                except RequestException as exc:
+                    error_msg = f"ERROR: RequestException for {url_str}: {exc}"
+                    if self._enable_logging:
+                        failure_logs.append(prefix + "failed - " + error_msg)
+                    gathered[url_str] = error_msg
+                except Exception as exc:
+                    error_msg = f"CRITICAL ERROR: Unexpected exception for {url_str}: {exc}"
+                    if self._enable_logging:
+                        failure_logs.append(prefix + "failed - " + error_msg)
+                    gathered[url_str] = error_msg
+
+        # Callers see results in the order the URLs were passed, not completion order.
+        result: Dict[str, Union[Response, str]] = {str(u_item): gathered[str(u_item)] for u_item in urls}
+
+        if self._enable_logging:
+            if failure_logs:
+                self._log(failure_logs)
+            self._log(prefix + "for multiple URLs completed")
         return result
 
     @staticmethod
@@ -474,22 +563,21 @@ class Request:
         stream: bool = False,
     ) -> Union[Response, Dict[str, Union[Response, str]]]:
         effective_timeout = timeout if timeout is not None else self._instance_timeout
-        kwargs = {
-            "headers": headers,
-            "timeout": effective_timeout,
-            "proxies": proxies,
-            "stream": stream,
-        }
-
         if len(urls) > 1:
-            return self._handle_multiple_requests("get", urls, **kwargs)
+            return self._handle_multiple_requests(
+                "get", urls,
+                headers=headers, timeout=effective_timeout, proxies=proxies, stream=stream,
+            )
         Request._require_urls("get", urls)
-        return self._handle_single_request("get", urls[0], **kwargs)
+        return self._handle_single_request(
+            "get", urls[0],
+            headers=headers, timeout=effective_timeout, proxies=proxies, stream=stream,
+        )
 
     def post(
         self,
         *urls: Union[str, bytes],
-        data: Optional[Union[str, bytes, Mapping[str, Any]]] = None,
+        data: Optional[Union[str, bytes, Mapping[str, Any], BinaryIO]] = None,
         json: Optional[Mapping[str, Any]] = None,
         files: Optional[Union[Mapping[str, FileValue], Iterable[Tuple[str, FileValue]]]] = None,
         headers: Optional[Mapping[str, str]] = None,
@@ -500,22 +588,18 @@ class Request:
         stream: bool = False,
     ) -> Union[Response, Dict[str, Union[Response, str]]]:
         effective_timeout = timeout if timeout is not None else self._instance_timeout
-        kwargs = {
-            "data": data,
-            "json": json,
-            "headers": headers,
-            "auth": auth,
-            "timeout": effective_timeout,
-            "proxies": proxies,
-            "cookies": cookies,
-            "files": files,
-            "stream": stream,
-        }
-
         if len(urls) > 1:
-            return self._handle_multiple_requests("post", urls, **kwargs)
+            return self._handle_multiple_requests(
+                "post", urls,
+                data=data, json=json, headers=headers, auth=auth, timeout=effective_timeout,
+                proxies=proxies, cookies=cookies, files=files, stream=stream,
+            )
         Request._require_urls("post", urls)
-        return self._handle_single_request("post", urls[0], **kwargs)
+        return self._handle_single_request(
+            "post", urls[0],
+            data=data, json=json, headers=headers, auth=auth, timeout=effective_timeout,
+            proxies=proxies, cookies=cookies, files=files, stream=stream,
+        )
 
     def delete(
         self,
@@ -525,21 +609,21 @@ class Request:
         proxies: Optional[Mapping[str, str]] = None,
     ) -> Union[Response, Dict[str, Union[Response, str]]]:
         effective_timeout = timeout if timeout is not None else self._instance_timeout
-        kwargs = {
-            "headers": headers,
-            "timeout": effective_timeout,
-            "proxies": proxies,
-        }
-
         if len(urls) > 1:
-            return self._handle_multiple_requests("delete", urls, **kwargs)
+            return self._handle_multiple_requests(
+                "delete", urls,
+                headers=headers, timeout=effective_timeout, proxies=proxies,
+            )
         Request._require_urls("delete", urls)
-        return self._handle_single_request("delete", urls[0], **kwargs)
+        return self._handle_single_request(
+            "delete", urls[0],
+            headers=headers, timeout=effective_timeout, proxies=proxies,
+        )
 
     def put(
         self,
         *urls: Union[str, bytes],
-        data: Optional[Union[str, bytes, Mapping[str, Any]]] = None,
+        data: Optional[Union[str, bytes, Mapping[str, Any], BinaryIO]] = None,
         json: Optional[Mapping[str, Any]] = None,
         files: Optional[Union[Mapping[str, FileValue], Iterable[Tuple[str, FileValue]]]] = None,
         headers: Optional[Mapping[str, str]] = None,
@@ -549,21 +633,18 @@ class Request:
         stream: bool = False,
     ) -> Union[Response, Dict[str, Union[Response, str]]]:
         effective_timeout = timeout if timeout is not None else self._instance_timeout
-        kwargs = {
-            "data": data,
-            "json": json,
-            "headers": headers,
-            "timeout": effective_timeout,
-            "proxies": proxies,
-            "files": files,
-            "verify": verify,
-            "stream": stream,
-        }
-
         if len(urls) > 1:
-            return self._handle_multiple_requests("put", urls, **kwargs)
+            return self._handle_multiple_requests(
+                "put", urls,
+                data=data, json=json, headers=headers, timeout=effective_timeout,
+                proxies=proxies, files=files, verify=verify, stream=stream,
+            )
         Request._require_urls("put", urls)
-        return self._handle_single_request("put", urls[0], **kwargs)
+        return self._handle_single_request(
+            "put", urls[0],
+            data=data, json=json, headers=headers, timeout=effective_timeout,
+            proxies=proxies, files=files, verify=verify, stream=stream,
+        )
 
     def request_sse(
         self,
@@ -593,24 +674,29 @@ class Request:
 
         with response:
             response.raise_for_status()
-            event = {"id": "", "event": "", "data": ""}
+            # Field matching and accumulation stay at the bytes level; only the
+            # assembled event is decoded (SSE payloads are UTF-8 by spec).
+            event_id = b""
+            event_name = b""
+            data_parts: List[bytes] = []
 
             def emit_event() -> Optional[Dict[str, str]]:
-                if not event["data"]:
+                nonlocal event_id, event_name
+                if not data_parts:
                     return None
                 ready_event = {
-                    "id": event["id"],
-                    "event": event["event"],
-                    "data": event["data"].rstrip("\n"),
+                    "id": event_id.decode("utf-8", errors="replace"),
+                    "event": event_name.decode("utf-8", errors="replace"),
+                    "data": b"\n".join(data_parts).decode("utf-8", errors="replace"),
                 }
-                event["id"] = ""
-                event["event"] = ""
-                event["data"] = ""
+                event_id = b""
+                event_name = b""
+                data_parts.clear()
                 return ready_event
 
-            for raw_line in response.iter_lines(decode_unicode=True):
-                line = raw_line.rstrip("\r\n")
-                if line == "":
+            for raw_line in response.iter_lines():
+                line = raw_line.rstrip(b"\r\n")
+                if line == b"":
                     ready_event = emit_event()
                     if ready_event is None:
                         continue
@@ -618,14 +704,16 @@ class Request:
                     if self._enable_logging:
                         self._log(f"SSE Event: {ready_event}")
                     continue
-                if line.startswith(":"):
+                field, sep, value = line.partition(b":")
+                if not sep or not field:
+                    # No colon (ignored) or a ':'-prefixed comment line.
                     continue
-                if line.startswith("id:"):
-                    event["id"] = line[3:].strip()
-                elif line.startswith("event:"):
-                    event["event"] = line[6:].strip()
-                elif line.startswith("data:"):
-                    event["data"] += line[5:].lstrip() + "\n"
+                if field == b"data":
+                    data_parts.append(value.lstrip())
+                elif field == b"event":
+                    event_name = value.strip()
+                elif field == b"id":
+                    event_id = value.strip()
 
             ready_event = emit_event()
             if ready_event is not None:
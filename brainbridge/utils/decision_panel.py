@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Literal, Optional, Union
 import os
 import sys
-import time
 import shutil
+import threading
 import unicodedata
+from time import monotonic
 
 from brainbridge.lib.runtime.terminal_core import keyboard
 
@@ -28,6 +30,19 @@ KeyName = Literal[
 OptionItem = Dict[Literal["prompt", "output"], str]
 
 
+_KEY_MAP: Dict[str, keyboard.Key] = {
+    "BackSpace": keyboard.Key.backspace,
+    "Tab": keyboard.Key.tab,
+    "Esc": keyboard.Key.esc,
+    "Enter": keyboard.Key.enter,
+    "up": keyboard.Key.up,
+    "down": keyboard.Key.down,
+    "left": keyboard.Key.left,
+    "right": keyboard.Key.right,
+}
+
+
+@lru_cache(maxsize=None)
 def _get_pynput_key(key_str: str) -> Union[keyboard.Key, keyboard.KeyCode]:
     """
     Convert a key name to the built-in keyboard object.
@@ -41,23 +56,34 @@ def _get_pynput_key(key_str: str) -> Union[keyboard.Key, keyboard.KeyCode]:
     >>> _get_pynput_key("w") == keyboard.KeyCode.from_char("w")
     True
     """
-    key_map: Dict[str, keyboard.Key] = {
-        "BackSpace": keyboard.Key.backspace,
-        "Tab": keyboard.Key.tab,
-        "Esc": keyboard.Key.esc,
-        "Enter": keyboard.Key.enter,
-        "up": keyboard.Key.up,
-        "down": keyboard.Key.down,
-        "left": keyboard.Key.left,
-        "right": keyboard.Key.right,
-    }
-    if key_str in key_map:
-        return key_map[key_str]
+    if key_str in _KEY_MAP:
+        return _KEY_MAP[key_str]
     if len(key_str) == 1:
         return keyboard.KeyCode.from_char(key_str.lower())
     raise ValueError(f"Unknown key string: {key_str}")
 
 
+_CHAR_WIDTH_CACHE: Dict[str, int] = {}
+
+
+def _char_width(ch: str) -> int:
+    """
+    Display width of a single character (0 for combining marks, 2 for wide).
+
+    Example:
+    >>> _char_width("a")
+    1
+    """
+    w = _CHAR_WIDTH_CACHE.get(ch)
+    if w is None:
+        if unicodedata.combining(ch):
+            w = 0
+        else:
+            w = 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+        _CHAR_WIDTH_CACHE[ch] = w
+    return w
+
+
 def _display_width(text: str) -> int:
     """
     Compute approximate terminal display width.
@@ -68,13 +94,7 @@ def _display_width(text: str) -> int:
     >>> _display_width("abc")
     3
     """
-    w = 0
-    for ch in text:
-        if unicodedata.combining(ch):
-            continue
-        east = unicodedata.east_asian_width(ch)
-        w += 2 if east in ("W", "F") else 1
-    return w
+    return sum(map(_char_width, text))
 
 
 def _trim_to_width(text: str, max_width: int) -> str:
@@ -93,10 +113,10 @@ def _trim_to_width(text: str, max_width: int) -> str:
     cur = 0
     out: List[str] = []
     for ch in text:
-        if unicodedata.combining(ch):
+        inc = _char_width(ch)
+        if inc == 0:
             out.append(ch)
             continue
-        inc = 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
         if cur + inc > max_width:
             break
         out.append(ch)
@@ -173,15 +193,35 @@ class DecisionPanelPage:
         self._prompt_text = prompt_text
         self._operation_tips = operation_tips
         self._clear_mode = clear_mode
+        self._clear_screen = self._select_clear_fn(clear_mode)
         self._refresh_interval = float(refresh_interval)
         self._enable_input_box = bool(enable_input_box)
         self._input_clear_keys = {item.lower() for item in (input_clear_keys or set())}
         self._input_return_mode = input_return_mode
         self._highlight_current = bool(highlight_current)
 
+        # Navigation keys never change after construction; match by set lookup.
+        self._up_keys = frozenset((
+            keyboard.Key.up, keyboard.Key.left,
+            keyboard.KeyCode.from_char("w"), keyboard.KeyCode.from_char("a"),
+        ))
+        self._down_keys = frozenset((
+            keyboard.Key.down, keyboard.Key.right,
+            keyboard.KeyCode.from_char("s"), keyboard.KeyCode.from_char("d"),
+        ))
+
         self._options: List[OptionItem] = []
         self._selected_index: int = 0
         self._running: bool = False
+        self._stop_event = threading.Event()
+        self._last_frame: Optional[List[str]] = None
+        # Coalesce key-repeat redraws: at most one frame per interval, with a
+        # trailing one-shot timer so the final position always gets painted.
+        self._min_draw_interval: float = 1 / 60
+        self._last_draw: float = 0.0
+        self._draw_timer: Optional[threading.Timer] = None
+        self._line_cache: Optional[tuple[List[str], List[str]]] = None
+        self._line_cache_width: int = -1
         self._result: Any = None
         self._input_text: str = ""
         self._input_cursor: int = 0
@@ -217,6 +257,7 @@ class DecisionPanelPage:
         """
         self._options = list(options)
         self._selected_index = 0
+        self._line_cache = None
 
     def set_tips(self, operation_tips: str) -> None:
         """
@@ -250,18 +291,46 @@ class DecisionPanelPage:
         self._input_text = ""
         self._input_cursor = 0
         self._running = True
+        self._stop_event.clear()
         self._draw()
 
         listener = keyboard.Listener(on_press=self._on_press)
         listener.start()
 
+        # Block until a key handler ends the page instead of polling on a timer.
         while self._running:
-            time.sleep(self._refresh_interval)
+            self._stop_event.wait()
 
         listener.join()
+        self._cancel_scheduled_draw()
         self._clear()
         return self._result
 
+    @staticmethod
+    def _select_clear_fn(clear_mode: Literal["system", "ansi", "none"]):
+        """
+        Pick the screen-clear callable once so _clear has no per-call branching.
+
+        :param clear_mode: Configured clear mode.
+        :return: Zero-argument callable, or None for "none".
+        Example:
+        >>> DecisionPanelPage._select_clear_fn("none") is None
+        True
+        """
+        def _ansi_clear() -> None:
+            print("\033[2J\033[H", end="", flush=True)
+
+        if clear_mode == "none":
+            return None
+        if clear_mode == "ansi":
+            return _ansi_clear
+        # "system" forks a shell per clear; use the equivalent escape codes
+        # whenever the terminal can take them and keep the fork as the
+        # fallback for dumb/non-tty outputs.
+        if sys.stdout.isatty() and os.environ.get("TERM") not in (None, "dumb"):
+            return _ansi_clear
+        return lambda: os.system("cls" if os.name == "nt" else "clear")
+
     def _clear(self) -> None:
         """
         Clear screen based on mode.
@@ -271,12 +340,9 @@ class DecisionPanelPage:
         >>> _page = DecisionPanelPage(clear_mode="none")
         >>> _page._clear()
         """
-        if self._clear_mode == "none":
-            return
-        if self._clear_mode == "ansi":
-            print("\033[2J\033[H", end="", flush=True)
-            return
-        os.system("cls" if os.name == "nt" else "clear")
+        self._last_frame = None
+        if self._clear_screen is not None:
+            self._clear_screen()
 
     @staticmethod
     def _term_size() -> tuple[int, int]:
@@ -307,27 +373,27 @@ class DecisionPanelPage:
         if not self._options:
             self._result = None
             self._running = False
+            self._stop_event.set()
             return False
 
         n = len(self._options)
 
-        def is_char(ch: str) -> bool:
-            return hasattr(key, "char") and getattr(key, "char") and str(getattr(key, "char")).lower() == ch
-
         moved = False
-        if key == keyboard.Key.up or key == keyboard.Key.left or is_char("w") or is_char("a"):
+        if key in self._up_keys:
             self._selected_index = (self._selected_index - 1 + n) % n
             moved = True
-        elif key == keyboard.Key.down or key == keyboard.Key.right or is_char("s") or is_char("d"):
+        elif key in self._down_keys:
             self._selected_index = (self._selected_index + 1) % n
             moved = True
         elif self._is_confirm_key(key):
             self._result = self._build_result()
             self._running = False
+            self._stop_event.set()
             return False
         elif self._key_bindings.get("back") is not None and key == self._key_bindings["back"]:
             self._result = None
             self._running = False
+            self._stop_event.set()
             return False
 
         if self._enable_input_box and self._handle_input_key(key):
@@ -335,10 +401,35 @@ class DecisionPanelPage:
             return True
 
         if moved:
-            self._draw()
+            self._schedule_draw()
 
         return True
 
+    def _schedule_draw(self) -> None:
+        """
+        Redraw now if the frame budget allows, otherwise arm a trailing timer.
+
+        :return: None
+        Example:
+        >>> _page = DecisionPanelPage(clear_mode="none")
+        >>> _page._schedule_draw()
+        """
+        remaining = self._min_draw_interval - (monotonic() - self._last_draw)
+        if remaining <= 0:
+            self._draw()
+            return
+        if self._draw_timer is None:
+            timer = threading.Timer(remaining, self._draw)
+            timer.daemon = True
+            self._draw_timer = timer
+            timer.start()
+
+    def _cancel_scheduled_draw(self) -> None:
+        timer = self._draw_timer
+        if timer is not None:
+            timer.cancel()
+            self._draw_timer = None
+
     def _build_result(self) -> Any:
         selection = self._options[self._selected_index]["output"]
         if self._enable_input_box and self._input_return_mode == "dict":
@@ -436,7 +527,8 @@ class DecisionPanelPage:
         >>> _page.set_options([{"prompt": "A", "output": "1"}])
         >>> _page._draw()
         """
-        self._clear()
+        self._draw_timer = None
+        self._last_draw = monotonic()
         cols, rows = DecisionPanelPage._term_size()
         t = self._theme
 
@@ -467,20 +559,28 @@ class DecisionPanelPage:
             start = self._selected_index - visible_opts + 1
         end = min(len(self._options), start + visible_opts)
 
-        for i in range(start, end):
-            opt = self._options[i]
-            idx = i + 1
-            label = f"{idx:>2}. {opt['prompt']}"
+        # Option rows only depend on the prompt text and panel width; render
+        # both states once and reuse them until the options or width change.
+        if self._line_cache is None or self._line_cache_width != inner_w:
             label_area = max(1, inner_w - 6)
-            label = _pad_to_width(label, label_area)
+            normal_lines: List[str] = []
+            selected_lines: List[str] = []
+            for i, opt in enumerate(self._options):
+                label = _pad_to_width(f"{i + 1:>2}. {opt['prompt']}", label_area)
+                normal_lines.append(_pad_to_width(f"   {label}   ", inner_w))
+                selected_lines.append(_pad_to_width(f" {t.pointer_left} {label} {t.pointer_right} ", inner_w))
+            self._line_cache = (normal_lines, selected_lines)
+            self._line_cache_width = inner_w
+        else:
+            normal_lines, selected_lines = self._line_cache
 
+        for i in range(start, end):
             if i == self._selected_index:
-                line = f" {t.pointer_left} {label} {t.pointer_right} "
+                rendered_line = selected_lines[i]
+                if self._highlight_current:
+                    rendered_line = f"\033[7m{rendered_line}\033[0m"
             else:
-                line = f"   {label}   "
-            rendered_line = _pad_to_width(line, inner_w)
-            if i == self._selected_index and self._highlight_current:
-                rendered_line = f"\033[7m{rendered_line}\033[0m"
+                rendered_line = normal_lines[i]
             lines.append(f"{t.border_v}{rendered_line}{t.border_v}")
 
         for _ in range(usable_rows - (end - start)):
@@ -502,8 +602,23 @@ class DecisionPanelPage:
         lines.append(f"{t.border_v}{hint_1}{t.border_v}")
         lines.append(f"{t.border_v}{hint_2}{t.border_v}")
         lines.append(f"{t.border_bottom_left}{t.border_h * inner_w}{t.border_bottom_right}")
-        sys.stdout.write("\r\n".join(lines) + "\r\n")
+
+        previous = self._last_frame
+        if previous is not None and len(previous) == len(lines):
+            # Navigation only changes a couple of lines; move the cursor back
+            # over the previous frame and repaint just the ones that differ.
+            out: List[str] = [f"\x1b[{len(lines)}A"]
+            for line, old_line in zip(lines, previous):
+                if line != old_line:
+                    out.append("\r" + line)
+                out.append("\x1b[1B")
+            out.append("\r")
+            sys.stdout.write("".join(out))
+        else:
+            self._clear()
+            sys.stdout.write("\r\n".join(lines) + "\r\n")
         sys.stdout.flush()
+        self._last_frame = lines
 
 if __name__ == "__main__":
     page = DecisionPanelPage(clear_mode="system", enter_key={"decision": "Enter", "back": "Esc"})
@@ -44,31 +44,35 @@ def display_loading_bar(
     total_steps = int(duration / interval)
     fill_steps = (size + chunk_size - 1) // chunk_size
 
+    # Every frame is a pure function of the step index, so render them all
+    # up front and reduce the animation loop to an index plus a sleep.
+    frames = []
     for i in range(total_steps + 1):
         cursor = i * chunk_size
-        frame = ''
         if method == "replace":
             fill_len = min(cursor, size)
-            frame = content_pool[:fill_len] + bg_pool[fill_len:]
-            if i >= fill_steps:
-                print(f"\r{content_pool[:size]}", end="", flush=True)
-                break
-
+            frames.append(content_pool[:fill_len] + bg_pool[fill_len:])
         elif method == "promote":
             head = min(cursor, size)
             tail = max(0, cursor - chunk_size)
-            train_segment = content_pool[tail:head]
-            frame = bg_pool[:tail] + train_segment + bg_pool[head:]
-            if tail >= size: break
-
+            frames.append(bg_pool[:tail] + content_pool[tail:head] + bg_pool[head:])
         elif method == "back_replace":
             if cursor <= size:
-                frame = content_pool[:cursor] + bg_pool[cursor:]
+                frames.append(content_pool[:cursor] + bg_pool[cursor:])
             else:
                 start_idx = (cursor - size) % len(raw_content)
-                frame = content_pool[start_idx: start_idx + size]
+                frames.append(content_pool[start_idx: start_idx + size])
+        else:
+            frames.append('')
+
+    for i in range(total_steps + 1):
+        if method == "replace" and i >= fill_steps:
+            print(f"\r{content_pool[:size]}", end="", flush=True)
+            break
+        if method == "promote" and i * chunk_size - chunk_size >= size:
+            break
 
-        print(f"\r{frame}", end="", flush=True)
+        print(f"\r{frames[i]}", end="", flush=True)
 
         if i < total_steps:
             _timer.sleep(interval)
@@ -12,6 +12,8 @@ class Time:
 
     sleep = sleep
 
+    _F_TIME_ORDER = ("Y", "M", "D", "h", "m", "s")
+
     class Timer:
         """
         A high-precision _timer for measuring elapsed time with customizable decimal precision.
@@ -39,6 +41,8 @@ class Time:
         0.00
         """
 
+        _VALID_PRECISIONS = frozenset((1, 2, 3, 4))
+
         def __init__(self, precision: Literal[1, 2, 3, 4]):
             """
             Initialize a Timer instance with specified precision.
@@ -53,11 +57,12 @@ class Time:
             Example:
             >>> _timer = Time.Timer(3)  # Initialize with 3 decimal places
             """
-            if not isinstance(precision, int) or precision not in [1, 2, 3, 4]:
+            if not isinstance(precision, int) or precision not in Time.Timer._VALID_PRECISIONS:
                 raise ValueError("Precision must be 1, 2, 3, or 4.")
 
             self._start_time = perf_counter()
             self._precision: Literal[1,2,3,4] = precision
+            self._format = f"{{:.{precision}f}}".format
 
         @property
         def precision(self) -> Literal[1, 2, 3, 4]:
@@ -89,9 +94,10 @@ class Time:
             >>> _timer = Time.Timer(2)
             >>> _timer.precision = 4
             """
-            if not isinstance(value, int) or value not in [1, 2, 3, 4]:
+            if not isinstance(value, int) or value not in Time.Timer._VALID_PRECISIONS:
                 raise ValueError("Precision must be 1, 2, 3, or 4.")
             self._precision = value
+            self._format = f"{{:.{value}f}}".format
 
         def passed(self) -> str:
             """
@@ -106,8 +112,7 @@ class Time:
             >>> _timer.passed()
             '0.005'
             """
-            elapsed_time = perf_counter() - self._start_time
-            return f"{elapsed_time:.{self._precision}f}"
+            return self._format(perf_counter() - self._start_time)
 
         def reset(self):
             """
@@ -147,11 +152,5 @@ class Time:
                 {'Y': 2026, 'D': 4}
             """
         _time = localtime()
-        return_time: Dict[Literal["Y", "M", "D", "h", "m", "s"], int] = {}
-        keys = {"Y": _time.tm_year, "M": _time.tm_mon, "D": _time.tm_mday,
-                "h": _time.tm_hour, "m": _time.tm_min, "s": _time.tm_sec}
-
-        for t in ["Y", "M", "D", "h", "m", "s"]:
-            if t in time_part:
-                return_time[t] = keys[t]
-        return return_time
+        values = (_time.tm_year, _time.tm_mon, _time.tm_mday, _time.tm_hour, _time.tm_min, _time.tm_sec)
+        return {key: value for key, value in zip(Time._F_TIME_ORDER, values) if key in time_part}